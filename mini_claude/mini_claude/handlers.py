@@ -36,6 +36,7 @@ from .tools.loop_detector import LoopDetector
 from .tools.scope_guard import ScopeGuard
 from .tools.context_guard import ContextGuard
 from .tools.output_validator import OutputValidator
+from .tools.thinker import MAX_SCAN_FILE_BYTES
 from .tools.habit_tracker import (
     get_habit_tracker,
     start_session as start_habit_session,
@@ -1823,6 +1824,7 @@ class Handlers:
         file_extensions: list[str] | None = None,
         exclude_paths: list[str] | None = None,
         exclude_strings: bool = True,
+        max_file_bytes: int = MAX_SCAN_FILE_BYTES,
     ) -> list[TextContent]:
         """Search codebase for code similar to a found issue pattern."""
         if not issue_pattern:
@@ -1842,7 +1844,8 @@ class Handlers:
         response = await loop.run_in_executor(
             None,
             lambda: self.thinker.find_similar_issues(
-                issue_pattern, project_path, file_extensions, exclude_paths, exclude_strings
+                issue_pattern, project_path, file_extensions, exclude_paths, exclude_strings,
+                max_file_bytes,
             )
         )
         return [TextContent(type="text", text=response.to_formatted_string())]
@@ -13,10 +13,11 @@ v2: Uses combined tools for 75% token reduction (66 tools -> 25 tools)
 import asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import CallToolResult, ListToolsResult, TextContent
 
 from .handlers import Handlers
-from .tool_definitions_v2 import TOOL_DEFINITIONS
+from .tool_definitions_v2 import list_tools_result, suggest_tool_names, validate_arguments
+from .tools.thinker import MAX_SCAN_FILE_BYTES
 
 
 # Initialize handlers (contains all tool instances)
@@ -27,18 +28,27 @@ server = Server("mini-claude")
 
 
 @server.list_tools()
-async def list_tools() -> list[Tool]:
+async def list_tools() -> ListToolsResult:
     """List available Mini Claude tools."""
-    return TOOL_DEFINITIONS
+    return list_tools_result()
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+# Arguments are validated below against validators built once, rather than
+# by the SDK, which rebuilds a validator from the schema on every call
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
     """
     Route tool calls to the appropriate handler.
 
     This is a thin routing layer - all logic is in handlers.py.
     """
+    error = validate_arguments(name, arguments)
+    if error:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Input validation error: {error}")],
+            isError=True,
+        )
+
     # Route to handler based on tool name
     match name:
         # =====================================================================
@@ -193,10 +203,14 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 file_extensions=arguments.get("file_extensions"),
                 exclude_paths=arguments.get("exclude_paths"),
                 exclude_strings=arguments.get("exclude_strings", True),
+                max_file_bytes=arguments.get("max_file_bytes", MAX_SCAN_FILE_BYTES),
             )
 
         case _:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            text = f"Unknown tool: {name}"
+            if suggestions := suggest_tool_names(name):
+                text += f". Did you mean: {', '.join(suggestions)}?"
+            return [TextContent(type="text", text=text)]
 
 
 def main():
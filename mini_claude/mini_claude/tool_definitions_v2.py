@@ -5,24 +5,137 @@ Combines 66 tools into ~20 tools using operation parameters.
 Reduces token overhead from ~20K to ~5K per message.
 """
 
-from mcp.types import Tool
+import difflib
+import functools
+import json
+from dataclasses import dataclass
+from typing import Optional
 
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from mcp.types import ListToolsResult, Tool
 
-TOOL_DEFINITIONS = [
+
+# Schema fragments shared by many tools. Tools reference the same dict
+# objects instead of each building its own copy - treat them as read-only.
+EMPTY_SCHEMA = {"type": "object", "properties": {}, "required": []}
+STRING = {"type": "string"}
+INTEGER = {"type": "integer"}
+STRING_LIST = {"type": "array", "items": STRING}
+SEVERITY = {"type": "string", "enum": ["critical", "warning", "info"]}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """
+    In-process definition of one tool.
+
+    Plain slotted records are cheap to build and read; the pydantic Tool
+    the MCP protocol needs is only made from them for listing.
+    """
+    name: str
+    description: str
+    input_schema: dict
+
+    def to_tool(self) -> Tool:
+        return Tool(name=self.name, description=self.description, inputSchema=self.input_schema)
+
+
+# Operations of the combined tools, as (operation, help) pairs. Each tool's
+# description and its "operation" enum are both rendered from one table,
+# so the two can't drift apart.
+MEMORY_OPERATIONS = (
+    ("remember", "Store a note (just content - category/relevance optional)"),
+    ("recall", "Get all memories for project"),
+    ("forget", "Clear project memories"),
+    ("search", "Find by file/tags/query (file_path, tags, query, limit)"),
+    ("clusters", "View grouped memories (cluster_id to expand)"),
+    ("cleanup", "Dedupe/cluster/decay (dry_run, min_relevance, max_age_days)"),
+    ("consolidate", "LLM-powered merge of related memories (tag, dry_run)"),
+    ("add_rule", "Add permanent rule (content, reason) - never decays"),
+    ("list_rules", "Get all rules for project"),
+    ("modify", "Edit memory (memory_id, content, relevance, category)"),
+    ("delete", "Remove memory (memory_id)"),
+    ("promote", "Promote memory to rule (memory_id, reason)"),
+    ("recent", "Get recent memories newest first (category, limit)"),
+)
+
+WORK_OPERATIONS = (
+    ("log_mistake", "Record error (description, file_path, how_to_avoid)"),
+    ("log_decision", "Record choice (decision, reason, alternatives)"),
+)
+
+SCOPE_OPERATIONS = (
+    ("declare", "Set task scope (task_description, in_scope_files, in_scope_patterns)"),
+    ("check", "Verify file is in scope (file_path)"),
+    ("expand", "Add files to scope (files_to_add, reason)"),
+    ("status", "Get violations"),
+    ("clear", "Reset scope"),
+)
+
+LOOP_OPERATIONS = (
+    ("record_edit", "Log file edit (file_path, description)"),
+    ("record_test", "Log test result (passed, error_message)"),
+    ("check", "Check if safe to edit (file_path)"),
+    ("status", "Get edit counts and warnings"),
+)
+
+CONTEXT_OPERATIONS = (
+    ("checkpoint_save", "Save task state (task_description, current_step, completed_steps, pending_steps, files_involved)"),
+    ("checkpoint_restore", "Restore last checkpoint (task_id optional)"),
+    ("checkpoint_list", "List saved checkpoints"),
+    ("verify_completion", "Claim task done + verify (task, evidence, verification_steps)"),
+    ("instruction_add", "Register critical instruction (instruction, reason, importance)"),
+    ("instruction_reinforce", "Get instructions to remember"),
+)
+
+THINK_OPERATIONS = (
+    ("research", "Search codebase + summarize (question, project_path, depth)"),
+    ("compare", "Structured tradeoffs (options, context, criteria)"),
+    ("challenge", "Devil's advocate checklist (assumption, context)"),
+    ("explore", "Brainstorm approaches (problem, constraints, project_path)"),
+    ("best_practice", "Pattern checklist (topic, language_or_framework)"),
+    ("audit", "Issue checklist (file_path, focus_areas, min_severity)"),
+)
+
+CONVENTION_OPERATIONS = (
+    ("add", "Store rule (project_path, rule, category, reason, examples, importance)"),
+    ("get", "Get rules (project_path, category)"),
+    ("check", "Check code/filename (project_path, code_or_filename)"),
+)
+
+OUTPUT_OPERATIONS = (
+    ("validate_code", "Check for fake/silent failures (code, context)"),
+    ("validate_result", "Check output for fakes (output, expected_format, should_contain, should_not_contain)"),
+)
+
+
+def _describe(summary: str, operations: tuple[tuple[str, str], ...]) -> str:
+    """Render a combined tool's description: summary, then one line per operation."""
+    return "\n".join([summary, *(f"- {op}: {text}" for op, text in operations)])
+
+
+def _operation_property(operations: tuple[tuple[str, str], ...], description: str = "Operation") -> dict:
+    """The "operation" property of a combined tool, listing its operations."""
+    return {"type": "string", "enum": [op for op, _ in operations], "description": description}
+
+
+TOOL_SPECS = (
     # =========================================================================
     # ESSENTIAL TOOLS (always needed)
     # =========================================================================
 
-    Tool(
+    ToolSpec(
         name="mini_claude_status",
         description="Check Mini Claude health. Returns: status, model, memory stats.",
-        inputSchema={"type": "object", "properties": {}, "required": []},
+        input_schema=EMPTY_SCHEMA,
     ),
 
-    Tool(
+    ToolSpec(
         name="session_start",
         description="START EVERY SESSION. Loads memories, past mistakes, checkpoints. Auto-cleans duplicates.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "project_path": {"type": "string", "description": "Project directory path"}
@@ -31,10 +144,10 @@ TOOL_DEFINITIONS = [
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="session_end",
         description="END EVERY SESSION. Saves work summary, decisions, mistakes to memory.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "project_path": {"type": "string", "description": "Project directory (optional)"}
@@ -43,10 +156,10 @@ TOOL_DEFINITIONS = [
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="pre_edit_check",
         description="Run BEFORE editing important files. Checks: past mistakes, loop risk, scope violations.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "file_path": {"type": "string", "description": "File about to edit"}
@@ -59,36 +172,19 @@ TOOL_DEFINITIONS = [
     # COMBINED TOOLS (grouped by domain)
     # =========================================================================
 
-    Tool(
+    ToolSpec(
         name="memory",
-        description="""Memory operations. Operations:
-- remember: Store a note (just content - category/relevance optional)
-- recall: Get all memories for project
-- forget: Clear project memories
-- search: Find by file/tags/query (file_path, tags, query, limit)
-- clusters: View grouped memories (cluster_id to expand)
-- cleanup: Dedupe/cluster/decay (dry_run, min_relevance, max_age_days)
-- consolidate: LLM-powered merge of related memories (tag, dry_run)
-- add_rule: Add permanent rule (content, reason) - never decays
-- list_rules: Get all rules for project
-- modify: Edit memory (memory_id, content, relevance, category)
-- delete: Remove memory (memory_id)
-- promote: Promote memory to rule (memory_id, reason)
-- recent: Get recent memories newest first (category, limit)""",
-        inputSchema={
+        description=_describe("Memory operations. Operations:", MEMORY_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["remember", "recall", "forget", "search", "clusters", "cleanup", "consolidate", "add_rule", "list_rules", "modify", "delete", "promote", "recent"],
-                    "description": "Operation to perform"
-                },
+                "operation": _operation_property(MEMORY_OPERATIONS, "Operation to perform"),
                 "project_path": {"type": "string", "description": "Project directory"},
                 "content": {"type": "string", "description": "For remember/add_rule/modify: content"},
                 "category": {"type": "string", "enum": ["discovery", "priority", "note", "rule", "mistake", "context"], "description": "For remember/modify: type"},
                 "relevance": {"type": "integer", "description": "For remember/modify: importance 1-10"},
                 "file_path": {"type": "string", "description": "For search: filter by file"},
-                "tags": {"type": "array", "items": {"type": "string"}, "description": "For search: filter by tags"},
+                "tags": {"type": "array", "items": STRING, "description": "For search: filter by tags"},
                 "query": {"type": "string", "description": "For search: keyword search"},
                 "limit": {"type": "integer", "description": "For search/recent: max results"},
                 "cluster_id": {"type": "string", "description": "For clusters: expand specific cluster"},
@@ -103,72 +199,49 @@ TOOL_DEFINITIONS = [
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="work",
-        description="""Work tracking. Operations:
-- log_mistake: Record error (description, file_path, how_to_avoid)
-- log_decision: Record choice (decision, reason, alternatives)""",
-        inputSchema={
+        description=_describe("Work tracking. Operations:", WORK_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["log_mistake", "log_decision"],
-                    "description": "Operation"
-                },
+                "operation": _operation_property(WORK_OPERATIONS),
                 "description": {"type": "string", "description": "For log_mistake: what went wrong"},
                 "file_path": {"type": "string", "description": "For log_mistake: affected file"},
                 "how_to_avoid": {"type": "string", "description": "For log_mistake: prevention"},
                 "decision": {"type": "string", "description": "For log_decision: what was decided"},
                 "reason": {"type": "string", "description": "For log_decision: why"},
-                "alternatives": {"type": "array", "items": {"type": "string"}, "description": "For log_decision: other options"},
+                "alternatives": {"type": "array", "items": STRING, "description": "For log_decision: other options"},
             },
             "required": ["operation"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="scope",
-        description="""Scope guard for multi-file tasks. Operations:
-- declare: Set task scope (task_description, in_scope_files, in_scope_patterns)
-- check: Verify file is in scope (file_path)
-- expand: Add files to scope (files_to_add, reason)
-- status: Get violations
-- clear: Reset scope""",
-        inputSchema={
+        description=_describe("Scope guard for multi-file tasks. Operations:", SCOPE_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["declare", "check", "expand", "status", "clear"],
-                    "description": "Operation"
-                },
+                "operation": _operation_property(SCOPE_OPERATIONS),
                 "task_description": {"type": "string", "description": "For declare: task being done"},
-                "in_scope_files": {"type": "array", "items": {"type": "string"}, "description": "For declare: allowed files"},
-                "in_scope_patterns": {"type": "array", "items": {"type": "string"}, "description": "For declare: glob patterns"},
+                "in_scope_files": {"type": "array", "items": STRING, "description": "For declare: allowed files"},
+                "in_scope_patterns": {"type": "array", "items": STRING, "description": "For declare: glob patterns"},
                 "file_path": {"type": "string", "description": "For check: file to verify"},
-                "files_to_add": {"type": "array", "items": {"type": "string"}, "description": "For expand: files to add"},
+                "files_to_add": {"type": "array", "items": STRING, "description": "For expand: files to add"},
                 "reason": {"type": "string", "description": "For expand: why adding"},
             },
             "required": ["operation"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="loop",
-        description="""Loop detection to prevent death spirals. Operations:
-- record_edit: Log file edit (file_path, description)
-- record_test: Log test result (passed, error_message)
-- check: Check if safe to edit (file_path)
-- status: Get edit counts and warnings""",
-        inputSchema={
+        description=_describe("Loop detection to prevent death spirals. Operations:", LOOP_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["record_edit", "record_test", "check", "status"],
-                    "description": "Operation"
-                },
+                "operation": _operation_property(LOOP_OPERATIONS),
                 "file_path": {"type": "string", "description": "File being edited"},
                 "description": {"type": "string", "description": "For record_edit: what changed"},
                 "passed": {"type": "boolean", "description": "For record_test: did tests pass"},
@@ -178,39 +251,29 @@ TOOL_DEFINITIONS = [
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="context",
-        description="""Context protection for long tasks. Operations:
-- checkpoint_save: Save task state (task_description, current_step, completed_steps, pending_steps, files_involved)
-- checkpoint_restore: Restore last checkpoint (task_id optional)
-- checkpoint_list: List saved checkpoints
-- verify_completion: Claim task done + verify (task, evidence, verification_steps)
-- instruction_add: Register critical instruction (instruction, reason, importance)
-- instruction_reinforce: Get instructions to remember""",
-        inputSchema={
+        description=_describe("Context protection for long tasks. Operations:", CONTEXT_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["checkpoint_save", "checkpoint_restore", "checkpoint_list", "verify_completion", "instruction_add", "instruction_reinforce"],
-                    "description": "Operation"
-                },
-                "task_description": {"type": "string"},
-                "current_step": {"type": "string"},
-                "completed_steps": {"type": "array", "items": {"type": "string"}},
-                "pending_steps": {"type": "array", "items": {"type": "string"}},
-                "files_involved": {"type": "array", "items": {"type": "string"}},
+                "operation": _operation_property(CONTEXT_OPERATIONS),
+                "task_description": STRING,
+                "current_step": STRING,
+                "completed_steps": STRING_LIST,
+                "pending_steps": STRING_LIST,
+                "files_involved": STRING_LIST,
                 "task_id": {"type": "string", "description": "For restore: specific checkpoint"},
                 "task": {"type": "string", "description": "For verify: task to verify"},
-                "evidence": {"type": "array", "items": {"type": "string"}, "description": "For verify: proof"},
-                "verification_steps": {"type": "array", "items": {"type": "string"}, "description": "For verify: checks"},
+                "evidence": {"type": "array", "items": STRING, "description": "For verify: proof"},
+                "verification_steps": {"type": "array", "items": STRING, "description": "For verify: checks"},
                 "instruction": {"type": "string", "description": "For instruction_add"},
-                "reason": {"type": "string"},
-                "importance": {"type": "integer"},
-                "project_path": {"type": "string"},
-                "handoff_summary": {"type": "string"},
-                "handoff_context_needed": {"type": "array", "items": {"type": "string"}},
-                "handoff_warnings": {"type": "array", "items": {"type": "string"}},
+                "reason": STRING,
+                "importance": INTEGER,
+                "project_path": STRING,
+                "handoff_summary": STRING,
+                "handoff_context_needed": STRING_LIST,
+                "handoff_warnings": STRING_LIST,
             },
             "required": ["operation"],
         },
@@ -219,37 +282,27 @@ TOOL_DEFINITIONS = [
     # NOTE: momentum tool REMOVED - redundant with Claude Code's native TodoWrite
     # Use TodoWrite for task tracking instead
 
-    Tool(
+    ToolSpec(
         name="think",
-        description="""Structured pause tools (local LLM). Value is the pause + structure, not intelligence.
-- research: Search codebase + summarize (question, project_path, depth)
-- compare: Structured tradeoffs (options, context, criteria)
-- challenge: Devil's advocate checklist (assumption, context)
-- explore: Brainstorm approaches (problem, constraints, project_path)
-- best_practice: Pattern checklist (topic, language_or_framework)
-- audit: Issue checklist (file_path, focus_areas, min_severity)""",
-        inputSchema={
+        description=_describe("Structured pause tools (local LLM). Value is the pause + structure, not intelligence.", THINK_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["research", "compare", "challenge", "explore", "best_practice", "audit"],
-                    "description": "Operation"
-                },
-                "question": {"type": "string"},
-                "project_path": {"type": "string"},
+                "operation": _operation_property(THINK_OPERATIONS),
+                "question": STRING,
+                "project_path": STRING,
                 "depth": {"type": "string", "enum": ["quick", "medium", "deep"]},
-                "options": {"type": "array", "items": {"type": "string"}},
-                "context": {"type": "string"},
-                "criteria": {"type": "array", "items": {"type": "string"}},
-                "assumption": {"type": "string"},
-                "problem": {"type": "string"},
-                "constraints": {"type": "array", "items": {"type": "string"}},
-                "topic": {"type": "string"},
-                "language_or_framework": {"type": "string"},
-                "file_path": {"type": "string"},
-                "focus_areas": {"type": "array", "items": {"type": "string"}},
-                "min_severity": {"type": "string", "enum": ["critical", "warning", "info"]},
+                "options": STRING_LIST,
+                "context": STRING,
+                "criteria": STRING_LIST,
+                "assumption": STRING,
+                "problem": STRING,
+                "constraints": STRING_LIST,
+                "topic": STRING,
+                "language_or_framework": STRING,
+                "file_path": STRING,
+                "focus_areas": STRING_LIST,
+                "min_severity": SEVERITY,
             },
             "required": ["operation"],
         },
@@ -258,51 +311,38 @@ TOOL_DEFINITIONS = [
     # NOTE: habit tool REMOVED - meta-tracking of tool usage adds noise without value
     # Work tracking (decisions, mistakes) is still available via the `work` tool
 
-    Tool(
+    ToolSpec(
         name="convention",
-        description="""Project conventions. Operations:
-- add: Store rule (project_path, rule, category, reason, examples, importance)
-- get: Get rules (project_path, category)
-- check: Check code/filename (project_path, code_or_filename)""",
-        inputSchema={
+        description=_describe("Project conventions. Operations:", CONVENTION_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["add", "get", "check"],
-                    "description": "Operation"
-                },
-                "project_path": {"type": "string"},
-                "rule": {"type": "string"},
+                "operation": _operation_property(CONVENTION_OPERATIONS),
+                "project_path": STRING,
+                "rule": STRING,
                 "category": {"type": "string", "enum": ["naming", "architecture", "style", "pattern", "avoid"]},
-                "reason": {"type": "string"},
-                "examples": {"type": "array", "items": {"type": "string"}},
-                "importance": {"type": "integer"},
-                "code_or_filename": {"type": "string"},
+                "reason": STRING,
+                "examples": STRING_LIST,
+                "importance": INTEGER,
+                "code_or_filename": STRING,
             },
             "required": ["operation", "project_path"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="output",
-        description="""Output validation. Operations:
-- validate_code: Check for fake/silent failures (code, context)
-- validate_result: Check output for fakes (output, expected_format, should_contain, should_not_contain)""",
-        inputSchema={
+        description=_describe("Output validation. Operations:", OUTPUT_OPERATIONS),
+        input_schema={
             "type": "object",
             "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["validate_code", "validate_result"],
-                    "description": "Operation"
-                },
-                "code": {"type": "string"},
-                "context": {"type": "string"},
-                "output": {"type": "string"},
-                "expected_format": {"type": "string"},
-                "should_contain": {"type": "array", "items": {"type": "string"}},
-                "should_not_contain": {"type": "array", "items": {"type": "string"}},
+                "operation": _operation_property(OUTPUT_OPERATIONS),
+                "code": STRING,
+                "context": STRING,
+                "output": STRING,
+                "expected_format": STRING,
+                "should_contain": STRING_LIST,
+                "should_not_contain": STRING_LIST,
             },
             "required": ["operation"],
         },
@@ -318,10 +358,10 @@ TOOL_DEFINITIONS = [
     # STANDALONE TOOLS (unique functionality, keep separate)
     # =========================================================================
 
-    Tool(
+    ToolSpec(
         name="scout_search",
         description="Search codebase semantically. Returns findings with files, lines, connections.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "query": {"type": "string", "description": "What to search for"},
@@ -332,111 +372,223 @@ TOOL_DEFINITIONS = [
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="scout_analyze",
         description="Analyze code with local LLM. Provide code and question.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "code": {"type": "string"},
-                "question": {"type": "string"},
+                "code": STRING,
+                "question": STRING,
             },
             "required": ["code", "question"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="file_summarize",
         description="Summarize file purpose. Modes: quick (pattern-based) or detailed (LLM).",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "file_path": {"type": "string"},
+                "file_path": STRING,
                 "mode": {"type": "string", "enum": ["quick", "detailed"], "default": "quick"},
             },
             "required": ["file_path"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="deps_map",
         description="Map file dependencies. Shows imports and optionally reverse deps.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "file_path": {"type": "string"},
+                "file_path": STRING,
                 "include_reverse": {"type": "boolean", "default": False},
-                "project_root": {"type": "string"},
+                "project_root": STRING,
             },
             "required": ["file_path"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="impact_analyze",
         description="Analyze change impact. Shows dependents, exports, risk level.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "file_path": {"type": "string"},
-                "project_root": {"type": "string"},
-                "proposed_changes": {"type": "string"},
+                "file_path": STRING,
+                "project_root": STRING,
+                "proposed_changes": STRING,
             },
             "required": ["file_path", "project_root"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="code_quality_check",
         description="Check code for AI slop: long functions, vague names, deep nesting.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "code": {"type": "string"},
+                "code": STRING,
                 "language": {"type": "string", "default": "python"},
             },
             "required": ["code"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="code_pattern_check",
         description="Check code against stored conventions using LLM.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "project_path": {"type": "string"},
-                "code": {"type": "string"},
+                "project_path": STRING,
+                "code": STRING,
             },
             "required": ["project_path", "code"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="audit_batch",
         description="Audit multiple files for issues. Supports glob patterns.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
-                "file_paths": {"type": "array", "items": {"type": "string"}},
-                "min_severity": {"type": "string", "enum": ["critical", "warning", "info"]},
+                "file_paths": STRING_LIST,
+                "min_severity": SEVERITY,
             },
             "required": ["file_paths"],
         },
     ),
 
-    Tool(
+    ToolSpec(
         name="find_similar_issues",
         description="Search codebase for bug pattern (e.g., 'except:\\s*pass').",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "issue_pattern": {"type": "string", "description": "Regex pattern"},
-                "project_path": {"type": "string"},
-                "file_extensions": {"type": "array", "items": {"type": "string"}},
-                "exclude_paths": {"type": "array", "items": {"type": "string"}},
+                "project_path": STRING,
+                "file_extensions": STRING_LIST,
+                "exclude_paths": STRING_LIST,
+                "exclude_strings": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Ignore matches inside string literals",
+                },
+                "max_file_bytes": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Skip files larger than this (default 10 MiB)",
+                },
             },
             "required": ["issue_pattern", "project_path"],
         },
     ),
-]
+)
+
+# Specs keyed by name. Plain dataclasses, so this is cheap to build eagerly
+TOOL_SPECS_BY_NAME = {spec.name: spec for spec in TOOL_SPECS}
+
+
+@functools.cache
+def tool_definitions() -> tuple[Tool, ...]:
+    """Every tool as an MCP Tool, built once per process on first call."""
+    return tuple(spec.to_tool() for spec in TOOL_SPECS)
+
+
+@functools.cache
+def tools_by_name() -> dict[str, Tool]:
+    """Tools keyed by name, so lookups are one hash probe, not a scan."""
+    return {tool.name: tool for tool in tool_definitions()}
+
+
+def suggest_tool_names(name: str) -> list[str]:
+    """Closest real tool names for an unknown one (e.g. "memory_recall" -> "memory")."""
+    known = tools_by_name()
+    prefix = name.split("_", 1)[0]
+    if prefix in known:
+        return [prefix]
+    return difflib.get_close_matches(name, known, n=3)
+
+
+def __getattr__(name: str):
+    """
+    Keep TOOL_DEFINITIONS and TOOLS_BY_NAME importable (PEP 562).
+
+    They are served from the cached factories above, so importing the
+    module never builds the pydantic models for callers that don't list
+    tools.
+    """
+    if name == "TOOL_DEFINITIONS":
+        return tool_definitions()
+    if name == "TOOLS_BY_NAME":
+        return tools_by_name()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def tool_payload_sizes() -> dict[str, int]:
+    """
+    Bytes each tool adds to every list_tools response.
+
+    Descriptions and schemas are re-sent to the client on every listing,
+    so this is the number to watch when trimming definitions. A
+    development aid, not part of any tool response:
+
+        python -c "from mini_claude.tool_definitions_v2 import tool_payload_sizes; print(tool_payload_sizes())"
+    """
+    return {
+        tool.name: len(json.dumps(tool.model_dump(mode="json", by_alias=True, exclude_none=True)))
+        for tool in tool_definitions()
+    }
+
+
+@functools.cache
+def list_tools_result() -> ListToolsResult:
+    """
+    The tools/list response, built once.
+
+    Definitions never change while the server runs, so every listing
+    shares one ListToolsResult and Tool list instead of building new ones.
+    The SDK still walks the tools on each request to check their names
+    and refill its own tool cache; only the wrapping is saved.
+    """
+    return ListToolsResult(tools=tool_definitions())
+
+
+@functools.cache
+def tool_validator(name: str) -> Validator:
+    """
+    The jsonschema validator for one tool, built on its first call.
+
+    jsonschema.validate() re-checks the schema and builds a new validator
+    on every call, which dominates the cost of validating arguments. Each
+    schema is checked and its validator built once instead - and only for
+    tools that are actually called, since the metaschema check costs a
+    few milliseconds per tool. name must be in TOOL_SPECS_BY_NAME.
+    """
+    schema = TOOL_SPECS_BY_NAME[name].input_schema
+    cls = validator_for(schema)
+    # The schemas are our own literals, so the metaschema check only guards
+    # against authoring mistakes - skipped under python -O
+    if __debug__:
+        cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_arguments(name: str, arguments: dict) -> Optional[str]:
+    """
+    Check tool call arguments against the tool's inputSchema.
+
+    Returns the most relevant error message, or None when the arguments
+    are valid or the tool is unknown (the router reports unknown tools).
+    """
+    if name not in TOOL_SPECS_BY_NAME:
+        return None
+    error = best_match(tool_validator(name).iter_errors(arguments))
+    return error.message if error else None
@@ -1,17 +1,39 @@
 """Mini Claude Tools - Individual capabilities that mini_claude provides."""
 
-from .scout import SearchEngine
-from .memory import MemoryStore
-from .summarizer import FileSummarizer
-from .dependencies import DependencyMapper
-from .conventions import ConventionTracker
-from .impact import ImpactAnalyzer
-from .session import SessionManager
-from .work_tracker import WorkTracker
-from .test_runner import TestRunner
-from .git_helper import GitHelper
-from .momentum_tracker import MomentumTracker
-from .thinker import Thinker
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .scout import SearchEngine
+    from .memory import MemoryStore
+    from .summarizer import FileSummarizer
+    from .dependencies import DependencyMapper
+    from .conventions import ConventionTracker
+    from .impact import ImpactAnalyzer
+    from .session import SessionManager
+    from .work_tracker import WorkTracker
+    from .test_runner import TestRunner
+    from .git_helper import GitHelper
+    from .momentum_tracker import MomentumTracker
+    from .thinker import Thinker
+
+# Submodule defining each exported class. They are imported on first access
+# (PEP 562), so importing one tool - e.g. the hooks loading habit_tracker on
+# every prompt - doesn't load every other tool and its dependencies.
+_LAZY_IMPORTS = {
+    "SearchEngine": ".scout",
+    "MemoryStore": ".memory",
+    "FileSummarizer": ".summarizer",
+    "DependencyMapper": ".dependencies",
+    "ConventionTracker": ".conventions",
+    "ImpactAnalyzer": ".impact",
+    "SessionManager": ".session",
+    "WorkTracker": ".work_tracker",
+    "TestRunner": ".test_runner",
+    "GitHelper": ".git_helper",
+    "MomentumTracker": ".momentum_tracker",
+    "Thinker": ".thinker",
+}
 
 __all__ = [
     "SearchEngine",
@@ -27,3 +49,16 @@ __all__ = [
     "MomentumTracker",
     "Thinker",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip this hook
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
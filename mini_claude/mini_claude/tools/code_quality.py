@@ -12,14 +12,16 @@ The solution: Check code BEFORE writing it. Flag:
 - Multiple responsibilities in one function
 """
 
+import functools
 import re
 from dataclasses import dataclass
+from itertools import chain, islice
 from typing import Optional
 from ..schema import MiniClaudeResponse, WorkLog
 
 
 # Names that are too vague/generic
-VAGUE_NAMES = {
+VAGUE_NAMES = frozenset({
     "data", "result", "temp", "tmp", "var", "val", "value",
     "item", "items", "thing", "things", "obj", "object",
     "handle", "process", "do", "run", "execute", "perform",
@@ -27,16 +29,42 @@ VAGUE_NAMES = {
     "foo", "bar", "baz", "test", "x", "y", "z", "i", "j", "k",
     "info", "details", "params", "args", "kwargs", "options",
     "input", "output", "ret", "res", "response", "request",
-}
+})
 
 # Prefixes that often indicate vague naming
-VAGUE_PREFIXES = [
+VAGUE_PREFIXES = (
     "do_", "handle_", "process_", "manage_", "run_",
     "perform_", "execute_", "my_", "the_", "get_data",
-]
-
-
-@dataclass
+)
+
+# Patterns used on every check() call, compiled once
+_PY_DEF_LINE_RE = re.compile(r'^(\s*)(def|async def)\s+(\w+)\s*\(', re.MULTILINE)
+_JS_FUNC_LINE_RE = re.compile(
+    r'^\s*(async\s+)?function\s+(\w+)\s*\(|^\s*(const|let|var)\s+(\w+)\s*=\s*(async\s*)?\([^)]*\)\s*=>',
+    re.MULTILINE,
+)
+_GENERIC_FUNC_LINE_RE = re.compile(r'^\s*(def|function|fn|func)\s+(\w+)', re.MULTILINE)
+
+# Function name plus, when the signature is closed, its parameter list
+_PY_FUNC_RE = re.compile(r'def\s+(\w+)\s*\((?:([^)]*)\))?')
+_JS_FUNC_RE = re.compile(
+    r'function\s+(\w+)\s*\((?:([^)]*)\))?|(\w+)\s*=\s*(?:async\s*)?\(([^)]*)\)\s*=>'
+)
+# Assignment targets, `(\w+)\s*=`, matched on the reversed source: the
+# scan can then skip straight to each "=" instead of trying a word match
+# at every character
+_VAR_ASSIGN_REVERSED_RE = re.compile(r'=\s*(\w+)')
+
+# The words if / elif and "else if", as `\b(?:elif|(else )?if)\b` -
+# group 1 is set for "else if", which counts as both an if and an elif.
+# Matching the trailing "if" first and checking what precedes it with
+# lookbehinds lets re search for that literal instead of trying the
+# pattern at every position.
+_BRANCH_RE = re.compile(r'if\b(?:(?<=\b(else )if)|(?<=\bif)|(?<=\belif))')
+_SECTION_COMMENT_RE = re.compile(r'#\s*-+|#\s*\w+:')
+
+
+@dataclass(frozen=True, slots=True)
 class QualityIssue:
     """A single code quality issue."""
     severity: str  # "error", "warning", "info"
@@ -89,15 +117,14 @@ class CodeQualityChecker:
         work_log = WorkLog()
         work_log.what_i_tried.append("checking code quality")
 
-        issues: list[QualityIssue] = []
-
-        # Run all checks
-        issues.extend(self._check_function_length(code, language))
-        issues.extend(self._check_naming(code, language))
-        issues.extend(self._check_parameters(code, language))
-        issues.extend(self._check_nesting(code, language))
-        issues.extend(self._check_line_length(code))
-        issues.extend(self._check_complexity_indicators(code, language))
+        issues = _find_issues(
+            code,
+            language,
+            max_function_lines=self.max_function_lines,
+            max_parameters=self.max_parameters,
+            max_nesting_depth=self.max_nesting_depth,
+            max_line_length=self.max_line_length,
+        )
 
         # Categorize by severity
         errors = [i for i in issues if i.severity == "error"]
@@ -134,9 +161,9 @@ class CodeQualityChecker:
                 formatted["suggestion"] = issue.suggestion
             formatted_issues.append(formatted)
 
-        # Build warnings list for response
+        # Build warnings list for response - only the top 10 are shown
         warning_messages = []
-        for issue in errors + warnings:
+        for issue in islice(chain(errors, warnings), 10):
             prefix = "❌" if issue.severity == "error" else "⚠️"
             msg = f"{prefix} {issue.message}"
             if issue.suggestion:
@@ -157,7 +184,7 @@ class CodeQualityChecker:
                     "total": len(issues),
                 },
             },
-            warnings=warning_messages[:10],  # Top 10 issues
+            warnings=warning_messages,
             suggestions=[
                 "Break long functions into smaller, focused ones",
                 "Use descriptive names that explain WHAT and WHY",
@@ -165,56 +192,86 @@ class CodeQualityChecker:
             ] if issues else [],
         )
 
+    def _run_checks(self, code: str, language: str) -> tuple[QualityIssue, ...]:
+        """Run all checks. Use _find_issues, which caches the result."""
+        issues: list[QualityIssue] = []
+
+        lines = code.split('\n')
+        if self._may_define_functions(code, language):
+            functions = self._find_functions(code, language)
+            issues.extend(self._check_function_length(lines, language))
+        else:
+            functions = []
+        issues.extend(self._check_naming(code, functions))
+        issues.extend(self._check_parameters(functions, language))
+        issues.extend(self._check_nesting(lines, language))
+        issues.extend(self._check_line_length(lines))
+        issues.extend(self._check_complexity_indicators(code, language))
+
+        return tuple(issues)
+
     def _check_function_length(
         self,
-        code: str,
+        lines: list[str],
         language: str,
     ) -> list[QualityIssue]:
         """Check for functions that are too long."""
         issues = []
 
-        # Pattern to find function definitions
+        # Pattern to find function definitions, and the lines that could
+        # match it - a substring test is much cheaper than a regex call, and
+        # most lines contain none of the keywords
         if language in ("python",):
-            pattern = r'^(\s*)(def|async def)\s+(\w+)\s*\('
+            pattern = _PY_DEF_LINE_RE
+            candidates = [i for i, line in enumerate(lines) if "def" in line]
         elif language in ("javascript", "typescript", "js", "ts"):
-            pattern = r'^\s*(async\s+)?function\s+(\w+)\s*\(|^\s*(const|let|var)\s+(\w+)\s*=\s*(async\s*)?\([^)]*\)\s*=>'
+            pattern = _JS_FUNC_LINE_RE
+            candidates = [
+                i for i, line in enumerate(lines)
+                if "function" in line or "=>" in line
+            ]
         else:
-            # Generic - look for function-like patterns
-            pattern = r'^\s*(def|function|fn|func)\s+(\w+)'
+            # Generic - look for function-like patterns ("func" also
+            # covers "function")
+            pattern = _GENERIC_FUNC_LINE_RE
+            candidates = [
+                i for i, line in enumerate(lines)
+                if "def" in line or "fn" in line or "func" in line
+            ]
+
+        end = 0  # Lines before this are inside an already-measured function
+        for i in candidates:
+            if i < end:
+                continue
 
-        lines = code.split('\n')
-        i = 0
-        while i < len(lines):
-            match = re.match(pattern, lines[i], re.MULTILINE)
-            if match:
-                # Extract function name
-                func_name = None
-                for group in match.groups():
-                    if group and group not in ('def', 'async def', 'function', 'async', 'const', 'let', 'var', 'fn', 'func'):
-                        func_name = group
-                        break
-
-                if not func_name:
-                    i += 1
-                    continue
+            match = pattern.match(lines[i])
+            if not match:
+                continue
 
-                # Count lines in function
-                start_line = i
-                func_lines = self._count_function_lines(lines, i, language)
+            # Extract function name
+            func_name = None
+            for group in match.groups():
+                if group and group not in ('def', 'async def', 'function', 'async', 'const', 'let', 'var', 'fn', 'func'):
+                    func_name = group
+                    break
 
-                if func_lines > self.max_function_lines:
-                    severity = "error" if func_lines > self.max_function_lines * 2 else "warning"
-                    issues.append(QualityIssue(
-                        severity=severity,
-                        category="length",
-                        message=f"Function '{func_name}' is {func_lines} lines (max: {self.max_function_lines})",
-                        line=start_line + 1,
-                        suggestion=f"Break into {func_lines // 20 + 1} smaller functions",
-                    ))
+            if not func_name:
+                continue
 
-                i += func_lines
-            else:
-                i += 1
+            # Count lines in function
+            func_lines = self._count_function_lines(lines, i, language)
+
+            if func_lines > self.max_function_lines:
+                severity = "error" if func_lines > self.max_function_lines * 2 else "warning"
+                issues.append(QualityIssue(
+                    severity=severity,
+                    category="length",
+                    message=f"Function '{func_name}' is {func_lines} lines (max: {self.max_function_lines})",
+                    line=i + 1,
+                    suggestion=f"Break into {func_lines // 20 + 1} smaller functions",
+                ))
+
+            end = i + func_lines
 
         return issues
 
@@ -237,7 +294,7 @@ class CodeQualityChecker:
             count = 1
             for i in range(start + 1, len(lines)):
                 line = lines[i]
-                stripped = line.strip()
+                stripped = line.lstrip()
 
                 # Skip empty lines and comments
                 if not stripped or stripped.startswith('#'):
@@ -245,8 +302,8 @@ class CodeQualityChecker:
                     continue
 
                 # Check indentation
-                current_indent = len(line) - len(line.lstrip())
-                if current_indent <= base_indent and stripped:
+                current_indent = len(line) - len(stripped)
+                if current_indent <= base_indent:
                     # Back to same or less indentation = function ended
                     break
 
@@ -263,37 +320,52 @@ class CodeQualityChecker:
                 line = lines[i]
                 count += 1
 
-                for char in line:
-                    if char == '{':
-                        brace_count += 1
-                        started = True
-                    elif char == '}':
-                        brace_count -= 1
+                # Only checked at line end, so brace order within a line
+                # doesn't matter
+                opens = line.count('{')
+                if opens:
+                    started = True
+                brace_count += opens - line.count('}')
 
                 if started and brace_count == 0:
                     break
 
             return count
 
-    def _check_naming(
+    def _may_define_functions(self, code: str, language: str) -> bool:
+        """Cheap pre-check: could any function pattern match this code?"""
+        if language == "python":
+            return "def" in code
+        # "func" also covers "function"
+        return any(marker in code for marker in ("def", "func", "fn", "=>"))
+
+    def _find_functions(
         self,
         code: str,
         language: str,
+    ) -> list[tuple[str, Optional[str]]]:
+        """Find (name, parameter list) for each function, in one pass."""
+        pattern = _PY_FUNC_RE if language == "python" else _JS_FUNC_RE
+
+        functions = []
+        for match in pattern.finditer(code):
+            name, params_str = match.group(1, 2)
+            if name is None:
+                # Arrow function
+                name, params_str = match.group(3, 4)
+            functions.append((name, params_str))
+
+        return functions
+
+    def _check_naming(
+        self,
+        code: str,
+        functions: list[tuple[str, Optional[str]]],
     ) -> list[QualityIssue]:
         """Check for vague or generic names."""
         issues = []
 
-        # Find function/method names
-        if language == "python":
-            func_pattern = r'def\s+(\w+)\s*\('
-        else:
-            func_pattern = r'function\s+(\w+)\s*\(|(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>'
-
-        for match in re.finditer(func_pattern, code):
-            name = match.group(1) or match.group(2)
-            if not name:
-                continue
-
+        for name, _ in functions:
             # Check for vague names
             name_lower = name.lower()
 
@@ -307,15 +379,14 @@ class CodeQualityChecker:
                 ))
 
             # Starts with vague prefix
-            for prefix in VAGUE_PREFIXES:
-                if name_lower.startswith(prefix):
-                    issues.append(QualityIssue(
-                        severity="info",
-                        category="naming",
-                        message=f"Function '{name}' has vague prefix '{prefix}'",
-                        suggestion="Consider more specific name like 'validate_user_email' instead of 'handle_email'",
-                    ))
-                    break
+            if name_lower.startswith(VAGUE_PREFIXES):
+                prefix = next(p for p in VAGUE_PREFIXES if name_lower.startswith(p))
+                issues.append(QualityIssue(
+                    severity="info",
+                    category="naming",
+                    message=f"Function '{name}' has vague prefix '{prefix}'",
+                    suggestion="Consider more specific name like 'validate_user_email' instead of 'handle_email'",
+                ))
 
             # Too short (single letter or two letters)
             if len(name) <= 2 and name_lower not in ('id', 'ok'):
@@ -327,9 +398,8 @@ class CodeQualityChecker:
                 ))
 
         # Check variable names in assignments
-        var_pattern = r'(\w+)\s*='
-        for match in re.finditer(var_pattern, code):
-            name = match.group(1)
+        for reversed_name in reversed(_VAR_ASSIGN_REVERSED_RE.findall(code[::-1])):
+            name = reversed_name[::-1]
             name_lower = name.lower()
 
             if name_lower in VAGUE_NAMES and name_lower not in ('i', 'j', 'k', 'x', 'y', 'z'):
@@ -345,35 +415,26 @@ class CodeQualityChecker:
 
     def _check_parameters(
         self,
-        code: str,
+        functions: list[tuple[str, Optional[str]]],
         language: str,
     ) -> list[QualityIssue]:
         """Check for functions with too many parameters."""
         issues = []
 
-        # Find function signatures
-        if language == "python":
-            pattern = r'def\s+(\w+)\s*\(([^)]*)\)'
-        else:
-            pattern = r'function\s+(\w+)\s*\(([^)]*)\)|(\w+)\s*=\s*(?:async\s*)?\(([^)]*)\)\s*=>'
+        # Don't count self/cls in Python
+        implicit = ('self', 'cls') if language == "python" else ()
 
-        for match in re.finditer(pattern, code, re.DOTALL):
-            groups = match.groups()
-            name = groups[0] or groups[2]
-            params_str = groups[1] or groups[3]
-
-            if not name or not params_str:
+        for name, params_str in functions:
+            # n commas means at most n + 1 parameters
+            if not params_str or params_str.count(',') < self.max_parameters:
                 continue
 
-            # Count parameters (split by comma, filter empty)
-            params = [p.strip() for p in params_str.split(',') if p.strip()]
-
-            # Don't count self/cls in Python
-            if language == "python":
-                params = [p for p in params if p not in ('self', 'cls')]
-
-            # Don't count *args, **kwargs
-            params = [p for p in params if not p.startswith('*')]
+            # Count parameters (split by comma, filter empty), not
+            # counting *args, **kwargs
+            params = [
+                p for p in map(str.strip, params_str.split(','))
+                if p and p not in implicit and not p.startswith('*')
+            ]
 
             if len(params) > self.max_parameters:
                 issues.append(QualityIssue(
@@ -387,20 +448,19 @@ class CodeQualityChecker:
 
     def _check_nesting(
         self,
-        code: str,
+        lines: list[str],
         language: str,
     ) -> list[QualityIssue]:
         """Check for deeply nested code."""
         issues = []
-        lines = code.split('\n')
+        depth = 0  # Brace depth before the current line
+        prev_nesting = 0  # Python nesting of the previous line, 0 if blank
 
         for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-
             # Count nesting by indentation
             stripped = line.lstrip()
             if not stripped:
+                prev_nesting = 0
                 continue
 
             if language == "python":
@@ -408,14 +468,14 @@ class CodeQualityChecker:
                 indent = len(line) - len(stripped)
                 nesting = indent // 4
             else:
-                # Other: count leading braces/keywords up to this point
-                nesting = 0
-                for prev_line in lines[:i]:
-                    nesting += prev_line.count('{') - prev_line.count('}')
+                # Other: count braces opened before this line
+                nesting = depth
+                depth += line.count('{') - line.count('}')
 
             if nesting > self.max_nesting_depth:
-                # Only report once per deeply nested block
-                if i == 0 or self._get_nesting(lines[i-1], language) <= self.max_nesting_depth:
+                # Only report once per deeply nested block (Python only -
+                # brace languages report each deeply nested line)
+                if i == 0 or prev_nesting <= self.max_nesting_depth:
                     issues.append(QualityIssue(
                         severity="warning",
                         category="complexity",
@@ -424,24 +484,16 @@ class CodeQualityChecker:
                         suggestion="Extract nested logic into separate functions",
                     ))
 
-        return issues
-
-    def _get_nesting(self, line: str, language: str) -> int:
-        """Get nesting level of a line."""
-        stripped = line.lstrip()
-        if not stripped:
-            return 0
+            if language == "python":
+                prev_nesting = nesting
 
-        if language == "python":
-            indent = len(line) - len(stripped)
-            return indent // 4
-        return 0
+        return issues
 
-    def _check_line_length(self, code: str) -> list[QualityIssue]:
+    def _check_line_length(self, lines: list[str]) -> list[QualityIssue]:
         """Check for lines that are too long."""
         issues = []
 
-        for i, line in enumerate(code.split('\n')):
+        for i, line in enumerate(lines):
             if len(line) > self.max_line_length:
                 # Only report egregious violations
                 if len(line) > self.max_line_length * 1.5:
@@ -464,11 +516,10 @@ class CodeQualityChecker:
         issues = []
 
         # Count conditionals in a function
-        if_count = len(re.findall(r'\bif\b', code))
-        elif_count = len(re.findall(r'\belif\b|\belse if\b', code))
+        branches = _BRANCH_RE.findall(code)
 
         # Rough cyclomatic complexity indicator
-        complexity = if_count + elif_count
+        complexity = len(branches) + branches.count("else ")
 
         if complexity > 10:
             issues.append(QualityIssue(
@@ -480,7 +531,7 @@ class CodeQualityChecker:
 
         # Check for god functions (doing too many things)
         # Indicators: many different operations, lots of comments explaining sections
-        section_comments = len(re.findall(r'#\s*-+|#\s*\w+:', code))
+        section_comments = len(_SECTION_COMMENT_RE.findall(code))
         if section_comments > 3:
             issues.append(QualityIssue(
                 severity="info",
@@ -502,11 +553,36 @@ class CodeQualityChecker:
         if name_lower in VAGUE_NAMES:
             return f"'{name}' is too vague - what specifically does it do/contain?"
 
-        for prefix in VAGUE_PREFIXES:
-            if name_lower.startswith(prefix):
-                return f"'{name}' has vague prefix - be more specific"
+        if name_lower.startswith(VAGUE_PREFIXES):
+            return f"'{name}' has vague prefix - be more specific"
 
         if len(name) <= 2 and name_lower not in ('id', 'ok', 'db', 'io'):
             return f"'{name}' is too short - use a descriptive name"
 
         return None
+
+
+@functools.lru_cache(maxsize=32)
+def _find_issues(
+    code: str,
+    language: str,
+    max_function_lines: int,
+    max_parameters: int,
+    max_nesting_depth: int,
+    max_line_length: int,
+) -> tuple[QualityIssue, ...]:
+    """
+    Run all checks on code under the given thresholds.
+
+    Cached, as the same code is often re-checked (retries, verification
+    passes). Keyed on the thresholds themselves rather than a checker, so
+    the cache holds no checker and a changed threshold is never answered
+    from it. The issues are frozen, so sharing them between calls is safe.
+    """
+    checker = CodeQualityChecker(
+        max_function_lines=max_function_lines,
+        max_parameters=max_parameters,
+        max_nesting_depth=max_nesting_depth,
+        max_line_length=max_line_length,
+    )
+    return checker._run_checks(code, language)
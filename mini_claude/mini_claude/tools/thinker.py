@@ -11,8 +11,15 @@ Helps Claude overcome tunnel vision and shallow research by:
 Uses web search + local LLM reasoning to think before coding.
 """
 
+import functools
 import json
-from typing import Optional
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Callable, Iterator, Optional
 from pathlib import Path
 
 import httpx
@@ -23,6 +30,54 @@ from .scout import SearchEngine
 from .memory import MemoryStore
 
 
+def _string_literal_mask(line: str) -> bytearray:
+    """
+    Mark which positions of a line fall inside a string literal.
+
+    One pass over the line answers the question for every match on it,
+    instead of rescanning the line prefix per match. mask[i] is 1 when
+    position i is inside a string; the extra last slot covers matches
+    that start at end of line. See _is_inside_string_literal for the
+    quote rules.
+    """
+    n = len(line)
+    mask = bytearray(n + 1)
+    # Track whether we're inside a string
+    in_single = False
+    in_double = False
+    i = 0
+
+    while i < n:
+        mask[i] = in_single or in_double
+        char = line[i]
+        step = 1
+
+        # Handle escape sequences
+        if char == '\\' and i + 1 < n:
+            step = 2  # Skip escaped character
+        # Handle triple quotes (simplified - just check if we're starting one)
+        elif i + 2 < n and line[i:i+3] == '"""' and not in_single:
+            in_double = not in_double
+            step = 3
+        elif i + 2 < n and line[i:i+3] == "'''" and not in_double:
+            in_single = not in_single
+            step = 3
+        # Handle single quotes (only if not in double quote)
+        elif char == "'" and not in_double:
+            in_single = not in_single
+        # Handle double quotes (only if not in single quote)
+        elif char == '"' and not in_single:
+            in_double = not in_double
+
+        # Positions inside a skipped escape/triple quote take the new state
+        for j in range(i + 1, i + step):
+            mask[j] = in_single or in_double
+        i += step
+
+    mask[n] = in_single or in_double
+    return mask
+
+
 def _is_inside_string_literal(line: str, match_start: int) -> bool:
     """
     Check if a match position is inside a string literal.
@@ -40,41 +95,272 @@ def _is_inside_string_literal(line: str, match_start: int) -> bool:
     Returns:
         True if the match is inside a string literal
     """
-    # Track whether we're inside a string
-    in_single = False
-    in_double = False
-    i = 0
+    return bool(_string_literal_mask(line)[min(match_start, len(line))])
 
-    while i < match_start and i < len(line):
-        char = line[i]
 
-        # Handle escape sequences
-        if char == '\\' and i + 1 < len(line):
-            i += 2  # Skip escaped character
+# Below this many files a worker pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 32
+
+# Files queued ahead of the consumer; bounds the work wasted after the match cap
+SCAN_WINDOW_FILES = 64
+
+# Default cap on the files find_similar_issues scans: larger files are
+# almost always generated or minified, and are reported as skipped
+MAX_SCAN_FILE_BYTES = 10 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class IssuePattern:
+    """A compiled find_similar_issues pattern."""
+    regex: re.Pattern
+    # Every match contains this literal, so files without it can be skipped
+    literal: Optional[re.Pattern] = None
+    # The pattern is nothing but the literal: a literal hit is a match
+    exact: bool = False
+
+
+def _classify_pattern(issue_pattern: str) -> tuple[str, bool]:
+    """
+    Find the longest literal run every match of the pattern must contain.
+
+    Only top-level literals count - anything inside groups, classes or
+    repeats is treated as unknown - so the result is always safe to use
+    as a prefilter. Returns (literal, exact), where literal is "" when the
+    pattern has no such run and exact is True when the whole pattern is
+    that one literal (TODO, eval\\(, ...).
+
+    The regex parser is a private stdlib module, so it is imported here
+    rather than at module level: if it is missing or its output looks
+    different, this returns ("", False) and the scan just runs the plain
+    regex on every line.
+    """
+    try:
+        try:
+            from re import _parser as sre_parse  # Python 3.11+
+        except ImportError:
+            import sre_parse
+        parsed = list(sre_parse.parse(issue_pattern, re.IGNORECASE))
+        longest = run = ""
+        for op, value in parsed:
+            if op == sre_parse.LITERAL:
+                run += chr(value)
+                if len(run) > len(longest):
+                    longest = run
+            else:
+                run = ""
+    except Exception:
+        return "", False
+    # Lines are matched one at a time, so a literal newline never matches
+    exact = bool(longest) and len(longest) == len(parsed) and "\n" not in longest
+    return longest, exact
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_issue_pattern(issue_pattern: str) -> IssuePattern:
+    """
+    Compile a find_similar_issues pattern once per process.
+
+    The same pattern is often searched repeatedly in a session, and the
+    scan applies it to every line of every file, so it must not be
+    recompiled per line. Raises re.error for invalid patterns.
+    """
+    regex = re.compile(issue_pattern, re.IGNORECASE)
+    literal, exact = _classify_pattern(issue_pattern)
+    return IssuePattern(
+        regex=regex,
+        literal=re.compile(re.escape(literal), re.IGNORECASE) if literal else None,
+        exact=exact,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclude_filter(exclude_paths: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Combine exclude substrings into one alternation.
+
+    A single search per path replaces testing every substring in turn.
+    Returns None when nothing is excluded.
+    """
+    if not exclude_paths:
+        return None
+    return re.compile("|".join(map(re.escape, dict.fromkeys(exclude_paths))))
+
+
+def _collect_source_files(
+    root: str,
+    extensions: tuple[str, ...],
+    excluded: Optional[re.Pattern],
+    match_full_path: bool = False,
+) -> tuple[list[str], int, int]:
+    """
+    Walk root once and return (matching files, excluded files, excluded dirs).
+
+    Excluded directories are pruned before descending instead of being
+    walked and filtered file by file. By default exclusions are matched
+    against the path relative to root, so a project that itself lives
+    under e.g. ~/lib is still searched by the default vendor filters.
+    With match_full_path they are matched anywhere in the full path, as
+    caller-supplied excludes (which may be absolute) expect. Hidden
+    entries and symlinked directories are not followed.
+    """
+    files = []
+    files_skipped = 0
+    dirs_skipped = 0
+    stack = [(root, "")]
+
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    rel_path = f"{rel_dir}/{entry.name}"
+                    match_path = entry.path if match_full_path else rel_path
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if excluded and excluded.search(match_path + "/"):
+                                dirs_skipped += 1
+                            else:
+                                stack.append((entry.path, rel_path))
+                        elif entry.name.endswith(extensions) and entry.is_file():
+                            if excluded and excluded.search(match_path):
+                                files_skipped += 1
+                            else:
+                                files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
             continue
 
-        # Handle triple quotes (simplified - just check if we're starting one)
-        if i + 2 < len(line):
-            triple = line[i:i+3]
-            if triple == '"""' and not in_single:
-                in_double = not in_double
-                i += 3
-                continue
-            elif triple == "'''" and not in_double:
-                in_single = not in_single
-                i += 3
-                continue
+    return files, files_skipped, dirs_skipped
 
-        # Handle single quotes (only if not in double quote)
-        if char == "'" and not in_double:
-            in_single = not in_single
-        # Handle double quotes (only if not in single quote)
-        elif char == '"' and not in_single:
-            in_double = not in_double
 
-        i += 1
+def _read_source(file_path: str) -> str:
+    """
+    Read a source file for scanning.
+
+    A plain read() rather than mmap: a file truncated while mapped (an
+    editor save during the scan) raises SIGBUS and kills the server.
+    """
+    with open(file_path, "rb") as f:
+        return f.read().decode("utf-8", errors="ignore")
+
+
+def _scan_file_for_issue(
+    file_path: str,
+    pattern: IssuePattern,
+    exclude_strings: bool,
+    max_file_bytes: int,
+) -> Optional[tuple[tuple[int, str], ...]]:
+    """
+    Scan one file for an issue pattern, returning (line, code) pairs.
+
+    Pure function of its arguments so find_similar_issues can run it on a
+    worker pool. Results are reused until the file's mtime or size
+    changes, so repeat searches in a session only rescan edited files.
+    Unreadable files yield no matches; files over max_file_bytes aren't
+    scanned and return None.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return ()
+    if stat.st_size > max_file_bytes:
+        return None
+    return _scan_file_snapshot(file_path, stat.st_mtime_ns, stat.st_size, pattern, exclude_strings)
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_file_snapshot(
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+    pattern: IssuePattern,
+    exclude_strings: bool,
+) -> tuple[tuple[int, str], ...]:
+    """Scan one version of a file. mtime_ns and size are only cache keys."""
+    matches = []
+    try:
+        content = _read_source(file_path)
+    except Exception:
+        return ()
+
+    if not content:
+        return ()
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    if pattern.literal:
+        # Only lines containing the required literal can match; finding them
+        # is a C-level search, so most lines never reach the Python loop
+        lines = _lines_containing(content, pattern.literal)
+    else:
+        lines = enumerate(content.removesuffix("\n").split("\n"), 1)
+
+    for line_num, line in lines:
+        # Lines from an exact literal search are already known to match
+        if pattern.exact or pattern.regex.search(line):
+            # Skip matches inside string literals - but a later match on the
+            # same line may still be real code: "eval(" + eval(x)
+            if exclude_strings:
+                in_string = _string_literal_mask(line)
+                if all(in_string[m.start()] for m in pattern.regex.finditer(line)):
+                    continue
+
+            matches.append((line_num, line.strip()[:100]))
+
+            if len(matches) >= 100:  # No caller keeps more than this
+                break
+
+    return tuple(matches)
+
 
-    return in_single or in_double
+def _lines_containing(content: str, literal: re.Pattern) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) once for each line containing literal."""
+    line_num = 1
+    counted_to = 0
+    pos = 0
+
+    while (hit := literal.search(content, pos)) is not None:
+        line_start = content.rfind("\n", 0, hit.start()) + 1
+        line_end = content.find("\n", hit.start())
+        if line_end == -1:
+            line_end = len(content)
+
+        line_num += content.count("\n", counted_to, line_start)
+        counted_to = line_start
+        yield line_num, content[line_start:line_end]
+        pos = line_end + 1
+
+
+def _iter_scan_results(
+    scan: Callable[[str], Optional[tuple[tuple[int, str], ...]]],
+    candidates: list[str],
+    pool: Optional[ThreadPoolExecutor],
+) -> Iterator[tuple[str, Optional[tuple[tuple[int, str], ...]]]]:
+    """
+    Yield (file, hits) for each candidate, in order, as scans finish.
+
+    Only SCAN_WINDOW_FILES scans are queued ahead of the consumer, so
+    results are handed over as they complete rather than held for the
+    whole tree, and stopping early leaves at most a window of wasted work.
+    """
+    if pool is None:
+        for file_path in candidates:
+            yield file_path, scan(file_path)
+        return
+
+    remaining = iter(candidates)
+    pending = deque(
+        (file_path, pool.submit(scan, file_path))
+        for file_path in islice(remaining, SCAN_WINDOW_FILES)
+    )
+    while pending:
+        file_path, future = pending.popleft()
+        for next_path in islice(remaining, 1):
+            pending.append((next_path, pool.submit(scan, next_path)))
+        yield file_path, future.result()
 
 
 # Default paths to exclude when searching for issues
@@ -949,6 +1235,7 @@ Depth: {depth} ({"brief overview" if depth == "quick" else "thorough analysis" i
         file_extensions: Optional[list[str]] = None,
         exclude_paths: Optional[list[str]] = None,
         exclude_strings: bool = True,
+        max_file_bytes: int = MAX_SCAN_FILE_BYTES,
     ) -> MiniClaudeResponse:
         """
         Search codebase for code similar to a found issue pattern.
@@ -957,14 +1244,14 @@ Depth: {depth} ({"brief overview" if depth == "quick" else "thorough analysis" i
             issue_pattern: The pattern to search for (e.g., "except: pass", "eval(")
             project_path: Root directory to search in
             file_extensions: File extensions to search (e.g., [".py", ".js"])
-            exclude_paths: Paths to exclude (default: vendor dirs, envs, site-packages)
+            exclude_paths: Substrings matched anywhere in the full path (default:
+                vendor dirs, envs, site-packages, matched below project_path only)
             exclude_strings: Skip matches inside string literals (default: True)
+            max_file_bytes: Skip files larger than this (default: 10 MiB)
 
         Returns:
             List of files and locations with similar patterns
         """
-        import re
-        import glob as glob_module
         work_log = WorkLog()
         work_log.what_i_tried.append(f"Searching for pattern: {issue_pattern}")
 
@@ -976,71 +1263,87 @@ Depth: {depth} ({"brief overview" if depth == "quick" else "thorough analysis" i
                 work_log=work_log,
             )
 
+        try:
+            compiled = _compile_issue_pattern(issue_pattern)
+        except re.error as e:
+            work_log.what_failed.append(f"Invalid regex: {e}")
+            return MiniClaudeResponse(
+                status="failed",
+                confidence="high",
+                reasoning=f"Invalid regex pattern '{issue_pattern}': {e}",
+                work_log=work_log,
+                suggestions=["Escape special characters, e.g. 'eval\\(' instead of 'eval('"],
+            )
+
         # Default extensions
         if not file_extensions:
             file_extensions = [".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".java", ".rs"]
 
-        # Use default exclusions if not specified
+        # Use default exclusions if not specified. The defaults only look at
+        # the part of the path below project_path; caller excludes may be
+        # absolute, so they are matched anywhere in the full path
+        match_full_path = exclude_paths is not None
         if exclude_paths is None:
             exclude_paths = DEFAULT_EXCLUDE_PATHS
 
-        # Build glob patterns
-        matches = []
+        # Collect candidate files first so the scan can be spread over a pool
         files_searched = 0
-        files_skipped = 0
-
-        for ext in file_extensions:
-            pattern = f"{project_path}/**/*{ext}"
-            for file_path in glob_module.glob(pattern, recursive=True):
-                # Skip excluded directories
-                if any(skip in file_path for skip in exclude_paths):
-                    files_skipped += 1
-                    continue
+        files_too_large = 0
+        candidates, files_skipped, dirs_skipped = _collect_source_files(
+            project_path,
+            tuple(file_extensions),
+            _compile_exclude_filter(tuple(exclude_paths)),
+            match_full_path,
+        )
 
-                files_searched += 1
-                try:
-                    content = Path(file_path).read_text(encoding="utf-8", errors="ignore")
-                    lines = content.splitlines()
-
-                    for line_num, line in enumerate(lines, 1):
-                        match = re.search(issue_pattern, line, re.IGNORECASE)
-                        if match:
-                            # Skip matches inside string literals
-                            if exclude_strings and _is_inside_string_literal(line, match.start()):
-                                continue
-
-                            matches.append({
-                                "file": file_path,
-                                "line": line_num,
-                                "code": line.strip()[:100],
-                            })
-
-                            if len(matches) >= 100:  # Limit matches
-                                break
-
-                except Exception:
-                    continue
+        # Hits are kept per file as (line, code) pairs, in scan order; dict
+        # rows are only built for what the response actually shows
+        files_affected: list[tuple[str, tuple[tuple[int, str], ...]]] = []
+        total_matches = 0
 
-                if len(matches) >= 100:
+        scan = functools.partial(
+            _scan_file_for_issue,
+            pattern=compiled,
+            exclude_strings=exclude_strings,
+            max_file_bytes=max_file_bytes,
+        )
+        pool = ThreadPoolExecutor() if len(candidates) > PARALLEL_SCAN_MIN_FILES else None
+        try:
+            for file_path, hits in _iter_scan_results(scan, candidates, pool):
+                if hits is None:
+                    files_too_large += 1
+                    continue
+                files_searched += 1
+                if hits:
+                    hits = hits[:100 - total_matches]
+                    files_affected.append((file_path, hits))
+                    total_matches += len(hits)
+                if total_matches >= 100:  # Limit matches
                     break
-            if len(matches) >= 100:
-                break
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
 
-        work_log.what_worked.append(f"Searched {files_searched} files, found {len(matches)} matches")
+        work_log.what_worked.append(f"Searched {files_searched} files, found {total_matches} matches")
         if files_skipped > 0:
             work_log.what_worked.append(f"Skipped {files_skipped} files in excluded paths")
+        if dirs_skipped > 0:
+            work_log.what_worked.append(f"Skipped {dirs_skipped} excluded directories")
+        if files_too_large > 0:
+            work_log.what_failed.append(
+                f"Did not search {files_too_large} files larger than {max_file_bytes} bytes"
+            )
 
-        # Group by file
-        files_affected = {}
-        for match in matches:
-            file = match["file"]
-            if file not in files_affected:
-                files_affected[file] = []
-            files_affected[file].append(match)
+        # At most 100 hits survive the cap, so every row is built exactly once
+        # and the same dicts back both matches and by_file
+        rows_by_file = {
+            f: [{"file": f, "line": line, "code": code} for line, code in hits]
+            for f, hits in files_affected
+        }
 
-        if matches:
+        if total_matches:
             status = "partial"
-            reasoning = f"Found {len(matches)} occurrences in {len(files_affected)} file(s)"
+            reasoning = f"Found {total_matches} occurrences in {len(files_affected)} file(s)"
         else:
             status = "success"
             reasoning = f"Pattern not found in {files_searched} files searched"
@@ -1054,18 +1357,20 @@ Depth: {depth} ({"brief overview" if depth == "quick" else "thorough analysis" i
                 "pattern": issue_pattern,
                 "files_searched": files_searched,
                 "files_skipped": files_skipped,
-                "total_matches": len(matches),
+                "dirs_skipped": dirs_skipped,
+                "files_too_large": files_too_large,
+                "total_matches": total_matches,
                 "files_affected": len(files_affected),
-                "matches": matches[:50],
-                "by_file": {k: v for k, v in list(files_affected.items())[:20]},
+                "matches": list(islice(chain.from_iterable(rows_by_file.values()), 50)),
+                "by_file": dict(islice(rows_by_file.items(), 20)),
             },
             warnings=[
-                f"{Path(f).name}: {len(m)} occurrence(s)"
-                for f, m in sorted(files_affected.items(), key=lambda x: len(x[1]), reverse=True)[:10]
+                f"{Path(f).name}: {len(hits)} occurrence(s)"
+                for f, hits in sorted(files_affected, key=lambda x: len(x[1]), reverse=True)[:10]
             ],
             suggestions=[
                 f"Fix pattern in {len(files_affected)} file(s) to prevent similar issues"
-            ] if matches else [],
+            ] if total_matches else [],
         )
 
     def _pattern_audit(self, content: str, lines: list[str], language: str) -> list[dict]: